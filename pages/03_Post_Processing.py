@@ -435,9 +435,9 @@ with tab2:
         try:
             if ext == ".csv":
                 try:
-                    df_neuron = pd.read_csv(temp_file_path, sep=",")
+                    df_neuron = pd.read_csv(temp_file_path, sep=",", engine="pyarrow")
                 except pd.errors.ParserError:
-                    df_neuron = pd.read_csv(temp_file_path, sep=";")
+                    df_neuron = pd.read_csv(temp_file_path, sep=";", engine="pyarrow")
             elif ext == ".xlsx":
                 df_neuron = pd.read_excel(temp_file_path)
             else:
@@ -670,6 +670,10 @@ with tab3:
             with col3:
                 fps = st.number_input(
                     "FPS", value=30, min_value=1, step=1, key="rf_mapping_fps")
+                # Merged rows come at the labeled data rate chosen in the neuron tab
+                data_fps = st.number_input(
+                    "Data Rate (Hz)", value=int(target_fps), min_value=1, step=1,
+                    key="rf_mapping_data_fps")
                 columns = st.session_state.merged_data.df_merged.columns.tolist()
                 size_col = st.selectbox(
                     "Size Column", columns, index=32, key="rf_mapping_size")
@@ -691,7 +695,8 @@ with tab3:
                         cmap=cmap,
                         bending=bending,
                         spikes=spikes,
-                        fps=fps
+                        fps=fps,
+                        data_fps=data_fps
                     )
                     st.success("Scatter Plot Animation generated successfully!")
 
@@ -908,6 +913,9 @@ with tab3:
                     with col3:
                         color_2 = st.color_picker(f"Line color for {scroll_columns[1]}",
                                                   value="#d62728", key="color2_scroll")
+                    window_size = st.number_input("Window size (samples shown)",
+                                                  value=100, min_value=10, step=10,
+                                                  key="scroll_window_size")
 
                     # Button to trigger generation
                     if st.button("Generate Scrolling Overlay Video"):
@@ -920,7 +928,8 @@ with tab3:
                                 video_path=st.session_state.labeled_video_path,
                                 color_1=color_1,
                                 color_2=color_2,
-                                title=title
+                                title=title,
+                                window_size=int(window_size)
                             )
 
                             st.success(
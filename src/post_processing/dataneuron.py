@@ -59,9 +59,9 @@ class DataNeuron:
         ext = os.path.splitext(neuron_path)[1].lower()
         if ext == ".csv":
             try:
-                df = pd.read_csv(neuron_path, sep=",")
+                df = pd.read_csv(neuron_path, sep=",", engine="pyarrow")
             except pd.errors.ParserError:
-                df = pd.read_csv(neuron_path, sep=";")
+                df = pd.read_csv(neuron_path, sep=";", engine="pyarrow")
         elif ext == ".xlsx":
             df = pd.read_excel(neuron_path)
         else:
@@ -117,19 +117,15 @@ class DataNeuron:
         """
         # Create Instantaneous Frequency Firing (IFF):
         # 1 divided by the difference between the current time and last spike time
-        spikes_loc = self.df[self.df['Spike'] == 1].index
-        self.df["IFF"] = np.nan
+        spike_rows = np.flatnonzero(self.df['Spike'].to_numpy() == 1)
+        spike_times = self.df['Time'].to_numpy()[spike_rows]
+        iff = np.full(len(self.df), np.nan)
+        with np.errstate(divide='ignore'):
+            iff[spike_rows[1:]] = 1 / np.diff(spike_times)
 
-        for i in range(1, len(spikes_loc)):
-            diff = self.df.loc[spikes_loc[i], 'Time'] - \
-                   self.df.loc[spikes_loc[i-1], 'Time']
-            # calculate the reciprocal of the difference
-            self.df.loc[spikes_loc[i], "IFF"] = 1 / diff
-
-        # fill the NaN values with the previous non-NaN value
-        self.df["IFF"].fillna(method='ffill', inplace=True)
-        # fill the remaining NaN values with 0
-        self.df["IFF"].fillna(0, inplace=True)
+        # fill the NaN values with the previous non-NaN value,
+        # then fill the remaining NaN values with 0
+        self.df["IFF"] = pd.Series(iff, index=self.df.index).ffill().fillna(0)
 
     def _get_frequency(self) -> int:
         """
@@ -166,12 +162,12 @@ class DataNeuron:
         min_time, max_time = 0, self.df['Time'].max()
 
         # Generate complete range of timestamps
-        full_time_range = np.arange(min_time, max_time + interval, interval)
-        full_df = pd.DataFrame({'Time': full_time_range})
-        full_df['Time'] = full_df['Time'].round(6)
+        full_time_range = np.arange(min_time, max_time + interval, interval).round(6)
         self.df['Time'] = self.df['Time'].round(6)
 
-        # Merge with original data
+        # Merge with original data, a hash join that is faster here than
+        # reindexing on the float Time index
+        full_df = pd.DataFrame({'Time': full_time_range})
         filled_df = full_df.merge(self.df, on='Time', how="left")
 
         # Fill missing Spikes with 0
@@ -179,8 +175,7 @@ class DataNeuron:
 
         # Fill IFF column if it exists
         if 'IFF' in filled_df.columns:
-            filled_df['IFF'].fillna(method='ffill', inplace=True)
-            filled_df['IFF'].fillna(0, inplace=True)
+            filled_df['IFF'] = filled_df['IFF'].ffill().fillna(0)
 
         self.df = filled_df
 
@@ -1,14 +1,19 @@
 import warnings
+import functools
+import queue
+import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from scipy.stats import gaussian_kde
-import tempfile
-import imageio.v2 as imageio  # newer version
+from scipy.signal import fftconvolve
+import imageio_ffmpeg
 from src.components.validation import Validation as Val
 from src.post_processing.datadlc import DataDLC
 from src.post_processing.mergeddata import MergedData
 import cv2
-from sklearn.preprocessing import MinMaxScaler
 from matplotlib.lines import Line2D
-from matplotlib.animation import FuncAnimation
+from matplotlib.colors import to_rgba_array
 from plotly.subplots import make_subplots
 import plotly.graph_objects as go
 import plotly.express as px
@@ -18,6 +23,7 @@ import numpy as np
 import sys
 import os
 import seaborn as sns
+from numba import njit
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 #! Make futurewarnings and runtimewarnings quiet for now
@@ -25,6 +31,534 @@ warnings.filterwarnings("ignore", category=FutureWarning)
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
 
+@njit(cache=True)
+def _draw_disks(frame, pts, colors, radius=5):
+    """
+    Draw filled disks onto a frame in place, one per point.
+
+    Points are drawn in order, so later points overwrite earlier ones exactly
+    like repeated cv2.circle calls. Disks are clipped to the frame.
+
+    Args:
+        frame (np.ndarray): (H, W, 3) uint8 image to draw on.
+        pts (np.ndarray): (N, 2) int32 array of (x, y) pixel coordinates.
+        colors (np.ndarray): (N, 3) uint8 array of colors in the frame's channel order.
+        radius (int): Disk radius in pixels.
+    """
+    height, width = frame.shape[0], frame.shape[1]
+    r2 = radius * radius
+    for i in range(pts.shape[0]):
+        cx, cy = pts[i, 0], pts[i, 1]
+        for y in range(max(cy - radius, 0), min(cy + radius, height - 1) + 1):
+            dy = y - cy
+            # Half-width of the disk on this scanline
+            half = 0
+            while (half + 1) * (half + 1) + dy * dy <= r2:
+                half += 1
+            for x in range(max(cx - half, 0), min(cx + half, width - 1) + 1):
+                frame[y, x, 0] = colors[i, 0]
+                frame[y, x, 1] = colors[i, 1]
+                frame[y, x, 2] = colors[i, 2]
+
+
+@njit(cache=True, fastmath=True)
+def _kde_eval(positions, values, covariance):
+    """
+    Evaluate a 2D Gaussian KDE directly at the given positions.
+
+    Samples and positions are whitened once with the Cholesky factor of the
+    covariance, so each pair only needs a squared Euclidean distance.
+
+    Args:
+        positions (np.ndarray): (2, M) array of evaluation points.
+        values (np.ndarray): (2, N) array of samples.
+        covariance (np.ndarray): (2, 2) kernel covariance matrix.
+
+    Returns:
+        np.ndarray: (M,) density at each position.
+    """
+    # Explicit 2x2 Cholesky factor L, with covariance = L @ L.T
+    l00 = np.sqrt(covariance[0, 0])
+    l10 = covariance[1, 0] / l00
+    l11 = np.sqrt(covariance[1, 1] - l10 * l10)
+    norm = 1.0 / (2 * np.pi * l00 * l11 * values.shape[1])
+
+    # Solve L @ w = v for samples and positions
+    data_w0 = values[0] / l00
+    data_w1 = (values[1] - l10 * data_w0) / l11
+    pos_w0 = positions[0] / l00
+    pos_w1 = (positions[1] - l10 * pos_w0) / l11
+
+    density = np.empty(positions.shape[1])
+    for j in range(positions.shape[1]):
+        p0, p1 = pos_w0[j], pos_w1[j]
+        total = 0.0
+        for i in range(values.shape[1]):
+            d0 = p0 - data_w0[i]
+            d1 = p1 - data_w1[i]
+            total += np.exp(-0.5 * (d0 * d0 + d1 * d1))
+        density[j] = total * norm
+    return density
+
+
+def _build_rf_figure(figsize, lim, homography_points, title, xlabel, ylabel,
+                     size_col, color_col, color_mapper):
+    """
+    Build the static parts of the RF mapping animation figure.
+
+    Args:
+        figsize (tuple): Figure size (width, height).
+        lim (tuple): Axis limits, shared by x and y.
+        homography_points (np.ndarray): Array of homography points (4, 2).
+        title (str): Plot title.
+        xlabel (str): X-axis label.
+        ylabel (str): Y-axis label.
+        size_col (str): Column for marker size, shown in the legend title.
+        color_col (str): Column for marker color.
+        color_mapper (ScalarMappable): Mapper for the colorbar, None for Spike coloring.
+
+    Returns:
+        tuple: (fig, scat), the figure and its empty persistent scatter artist.
+    """
+    fig, ax = plt.subplots(figsize=figsize)
+    ax.set_xlim(lim)
+    ax.set_ylim(lim)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+
+    # Homography lines
+    for point in homography_points:
+        ax.axhline(y=point[1], color='gray', linestyle='--', alpha=0.5)
+        ax.axvline(x=point[0], color='gray', linestyle='--', alpha=0.5)
+
+    # Add legend or colorbar
+    if color_col == "Spike":
+        legend_elements = [
+            Line2D([0], [0], marker='o', color='w',
+                   markerfacecolor='blue', markersize=10,
+                   label='Spike'),
+            Line2D([0], [0], marker='o', color='w',
+                   markerfacecolor='grey', markersize=10,
+                   label='No Spike')
+        ]
+        ax.legend(handles=legend_elements, loc="upper left",
+                  title=f"Spike Status\n Circle Size ∝ {size_col}")
+    else:
+        ax.legend(loc="upper left",
+                  title=f"Circle Size ∝ {size_col}")
+        cbar = fig.colorbar(color_mapper, ax=ax)
+        cbar.set_label(f'{color_col} (Color)')
+
+    # Persistent scatter artist, updated in place every frame
+    scat = ax.scatter([], [], s=[], alpha=0.7, edgecolors=None)
+    return fig, scat
+
+
+def _render_rf_frame(fig, scat, history, k):
+    """
+    Draw the first k history points and return the canvas as an RGBA view.
+
+    Args:
+        fig (plt.Figure): Figure built by _build_rf_figure.
+        scat (PathCollection): The figure's persistent scatter artist.
+        history (tuple): (xy, size, color) float32 arrays for every row.
+        k (int): Number of rows to show.
+
+    Returns:
+        np.ndarray: (H, W, 4) uint8 view of the canvas, valid until the next draw.
+    """
+    history_xy, history_size, history_color = history
+    scat.set_offsets(history_xy[:k])
+    scat.set_sizes(history_size[:k])
+    scat.set_facecolors(history_color[:k])
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba())
+
+
+# Per-process figure used by the RF animation worker pool
+_rf_worker = None
+
+
+def _init_rf_worker(figure_args, history):
+    global _rf_worker
+    fig, scat = _build_rf_figure(*figure_args)
+    _rf_worker = (fig, scat, history)
+
+
+def _render_rf_chunk(ends):
+    # One RGB buffer per chunk, alpha is dropped to cut what is pickled back
+    fig, scat, history = _rf_worker
+    width, height = fig.canvas.get_width_height()
+    frames = np.empty((len(ends), height, width, 3), dtype=np.uint8)
+    for frame, k in zip(frames, ends):
+        frame[...] = _render_rf_frame(fig, scat, history, k)[:, :, :3]
+    return frames
+
+
+@njit(cache=True)
+def _lttb(x, y, n_out):
+    """
+    Pick the points of a series to keep with Largest-Triangle-Three-Buckets.
+
+    The first and last points are always kept. Every bucket in between keeps
+    the point forming the largest triangle with the previously kept point and
+    the mean of the next bucket, which preserves peaks and the visual shape.
+
+    Args:
+        x (np.ndarray): (N,) monotonic x values.
+        y (np.ndarray): (N,) y values.
+        n_out (int): Number of points to keep.
+
+    Returns:
+        np.ndarray: Sorted int64 indices of the kept points.
+    """
+    n = x.shape[0]
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    kept = np.empty(n_out, dtype=np.int64)
+    kept[0] = 0
+    kept[n_out - 1] = n - 1
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        # Mean of the next bucket is the third corner of the triangle
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = 0.0
+        avg_y = 0.0
+        for j in range(avg_start, avg_end):
+            avg_x += x[j]
+            avg_y += y[j]
+        avg_x /= avg_end - avg_start
+        avg_y /= avg_end - avg_start
+
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        best = start
+        best_area = -1.0
+        for j in range(start, end):
+            area = abs((x[a] - avg_x) * (y[j] - y[a])
+                       - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best_area = area
+                best = j
+        kept[i + 1] = best
+        a = best
+    return kept
+
+
+def _build_scroll_figure(figsize, columns, index, signals, title,
+                         color_1, color_2, threshold):
+    """
+    Build the static parts of the scroll-over plot.
+
+    Args:
+        figsize (tuple): Figure size (width, height).
+        columns (list of str): Names of the plotted columns.
+        index (np.ndarray): X values shared by all signals.
+        signals (np.ndarray): (len(columns), N) array, one row of values per column.
+        title (str): Title for the plot.
+        color_1 (str): Color for the first signal.
+        color_2 (str): Color for the other signals.
+        threshold (float): Threshold drawn on the Bending_ZScore axis.
+
+    Returns:
+        tuple: Scroll state for _render_scroll_frame.
+    """
+    fig, axes = plt.subplots(len(columns), 1, figsize=figsize, sharex=True)
+    if len(columns) == 1:
+        axes = [axes]
+
+    line_handles = []
+    line_labels = []
+    signal_lines = []
+    cursor_lines = []
+
+    for i, col in enumerate(columns):
+        ax = axes[i]
+        color = color_1 if i == 0 else color_2
+
+        # The main signal, filled in per frame
+        line, = ax.plot([], [], label=col, color=color)
+        signal_lines.append(line)
+        line_handles.append(line)
+        line_labels.append(col)
+
+        ax.set_ylim(0, np.nanmax(signals[i]))
+        cursor_lines.append(ax.axvline(0, color='black', linestyle='--'))
+        ax.xaxis.set_visible(False)
+
+        # Add threshold line if needed
+        if col == "Bending_ZScore":
+            ax.axhline(y=threshold, color='grey', linestyle='--')
+            threshold_line = Line2D(
+                [0], [0], color='grey', linestyle='--', label='Threshold')
+            line_handles.append(threshold_line)
+            line_labels.append('Threshold')
+
+    fig.legend(handles=line_handles,
+               labels=line_labels,
+               loc='center right',
+               ncol=1,
+               fontsize=8)
+
+    fig.suptitle(title, fontsize=12)
+    return fig, axes, signal_lines, cursor_lines, index, signals
+
+
+def _render_scroll_frame(scroll, frame_idx, window_size=100, out=None):
+    """
+    Draw the scroll plot centred on a frame and return it as an RGB image.
+
+    Args:
+        scroll (tuple): State built by _build_scroll_figure.
+        frame_idx (int): Video frame (data row) to centre the window on.
+        window_size (int): Number of rows shown.
+        out (np.ndarray, optional): (H, W, 3) uint8 buffer to copy the RGB
+            pixels into, e.g. a slice of a larger frame.
+
+    Returns:
+        np.ndarray: out if given, else an (H, W, 3) uint8 view of the canvas
+            that is only valid until the next draw.
+    """
+    fig, axes, signal_lines, cursor_lines, index, signals = scroll
+    start_idx = max(0, frame_idx - window_size // 2)
+    end_idx = min(len(index), start_idx + window_size)
+
+    start_xlim = start_idx if start_idx != 0 else frame_idx - window_size // 2
+    end_xlim = start_xlim + window_size
+
+    # Windows wider than the canvas are reduced to about one point per pixel
+    n_out = int(fig.bbox.width)
+    x_window = index[start_idx:end_idx]
+
+    for ax, line, cursor, signal in zip(axes, signal_lines, cursor_lines, signals):
+        y_window = signal[start_idx:end_idx]
+        if len(x_window) > n_out:
+            kept = _lttb(x_window.astype(np.float64), y_window.astype(np.float64), n_out)
+            line.set_data(x_window[kept], y_window[kept])
+        else:
+            line.set_data(x_window, y_window)
+        cursor.set_xdata([frame_idx, frame_idx])
+        ax.set_xlim(start_xlim, end_xlim)
+
+    fig.canvas.draw()
+    rgb = np.asarray(fig.canvas.buffer_rgba())[:, :, :3]
+    if out is None:
+        return rgb
+    out[...] = rgb
+    return out
+
+
+# Per-process figure and window size used by the scroll-over video worker pool
+_scroll_worker = None
+_scroll_window_size = None
+
+
+def _init_scroll_worker(figure_args, window_size):
+    global _scroll_worker, _scroll_window_size
+    _scroll_worker = _build_scroll_figure(*figure_args)
+    _scroll_window_size = window_size
+
+
+def _render_scroll_chunk(frame_indices):
+    # One buffer per chunk, filled in place and sent back as a single array
+    width, height = _scroll_worker[0].canvas.get_width_height()
+    frames = np.empty((len(frame_indices), height, width, 3), dtype=np.uint8)
+    for frame, k in zip(frames, frame_indices):
+        _render_scroll_frame(_scroll_worker, k, _scroll_window_size, out=frame)
+    return frames
+
+
+def _render_in_pool(initializer, initargs, render_chunk, keys, workers, chunk_size):
+    """
+    Render frames on a process pool and yield them in order.
+
+    Each worker builds its own figure through the initializer, then renders
+    chunks of keys. At most one chunk per worker plus one more are in flight,
+    which with the chunk size bounds the frames held in the parent.
+    Closing the generator early cancels the chunks that haven't started.
+
+    Args:
+        initializer (callable): Builds the per-process figure.
+        initargs (tuple): Arguments for the initializer.
+        render_chunk (callable): Renders a list of keys into a list of frames.
+        keys (list): One key per frame, in output order.
+        workers (int): Number of worker processes.
+        chunk_size (int): Number of frames per task.
+
+    Yields:
+        np.ndarray: The rendered frames, in the order of keys.
+    """
+    executor = ProcessPoolExecutor(max_workers=workers,
+                                   initializer=initializer,
+                                   initargs=initargs)
+    try:
+        pending = deque()
+        for i in range(0, len(keys), chunk_size):
+            pending.append(executor.submit(render_chunk, keys[i:i + chunk_size]))
+            if len(pending) > workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _drain_pipe(pipe, chunks):
+    # Runs on a daemon thread, holds only the pipe so the writer can be collected
+    chunks.append(pipe.read())
+
+
+class _VideoPipeWriter:
+    """
+    Encode RGB frames to an in-memory MP4 through an ffmpeg pipe.
+
+    Mirrors the append_data/close interface of the imageio writer, but close()
+    returns the encoded bytes instead of leaving a file on disk. The MP4 is
+    fragmented because a pipe can't be seeked back to write the index up front.
+
+    Use it as a context manager, leaving the block without calling close()
+    (e.g. on an exception) aborts ffmpeg instead of leaving it running.
+    """
+
+    def __init__(self, fps: int, codec: str, codec_params: list[str] = None):
+        self.fps = fps
+        self.codec = codec
+        self.codec_params = codec_params or []
+        self._proc = None
+        self._shape = None
+        self._chunks = []
+        self._stderr_chunks = []
+        self._drains = []
+        # Outcome of the first close(), later calls return or raise it again
+        self._closed = False
+        self._result = b""
+        self._error = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.abort()
+
+    def _start(self, height: int, width: int, channels: int):
+        # RGBA frames are sent as-is so callers can pass canvas buffers without a copy
+        pix_fmt = "rgba" if channels == 4 else "rgb24"
+        command = [imageio_ffmpeg.get_ffmpeg_exe(), "-hide_banner", "-loglevel", "error",
+                   "-f", "rawvideo", "-pix_fmt", pix_fmt, "-s", f"{width}x{height}",
+                   "-r", str(self.fps), "-i", "pipe:0",
+                   # yuv420p needs even dimensions
+                   "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+                   "-c:v", self.codec, *self.codec_params, "-pix_fmt", "yuv420p",
+                   "-movflags", "frag_keyframe+empty_moov+default_base_moof",
+                   "-f", "mp4", "pipe:1"]
+        self._proc = subprocess.Popen(command, stdin=subprocess.PIPE,
+                                      stdout=subprocess.PIPE,
+                                      stderr=subprocess.PIPE)
+        # Drain stdout and stderr on their own threads so ffmpeg never blocks
+        # on a full pipe
+        self._drains = [
+            threading.Thread(target=_drain_pipe, args=(pipe, chunks), daemon=True)
+            for pipe, chunks in ((self._proc.stdout, self._chunks),
+                                 (self._proc.stderr, self._stderr_chunks))]
+        for drain in self._drains:
+            drain.start()
+
+    def append_data(self, frame: np.ndarray):
+        """
+        Encode one frame.
+
+        Args:
+            frame (np.ndarray): (H, W, 3) or (H, W, 4) uint8 RGB(A) image,
+                alpha is ignored.
+
+        Raises:
+            ValueError: If the frame size changes between frames.
+            RuntimeError: If ffmpeg exits early or the writer is closed.
+        """
+        if self._closed:
+            raise RuntimeError("Cannot append frames to a closed video writer.")
+        frame = np.ascontiguousarray(frame, dtype=np.uint8)
+        if self._proc is None:
+            self._shape = frame.shape
+            self._start(*frame.shape)
+        elif frame.shape != self._shape:
+            raise ValueError(f"Frame shape {frame.shape} does not match {self._shape}.")
+        try:
+            self._proc.stdin.write(frame.data)
+        except BrokenPipeError:
+            self.close()
+            raise RuntimeError("ffmpeg exited before all frames were written.")
+
+    def close(self) -> bytes:
+        """
+        Finish encoding and return the video.
+
+        Safe to call more than once, repeated calls return the same bytes or
+        raise the same error as the first.
+
+        Returns:
+            bytes: The encoded MP4, empty if no frames were written.
+
+        Raises:
+            RuntimeError: If ffmpeg failed to encode the video or the writer
+                was aborted.
+        """
+        if not self._closed:
+            self._closed = True
+            try:
+                self._result = self._finish()
+            except Exception as e:
+                self._error = e
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+    def abort(self):
+        """
+        Stop ffmpeg without finishing the video, a no-op once closed.
+
+        Later calls to close() raise a RuntimeError.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._error = RuntimeError("The video writer was aborted.")
+        if self._proc is None:
+            return
+        self._close_stdin()
+        if self._proc.poll() is None:
+            self._proc.kill()
+        self._proc.wait()
+        self._join_drains()
+
+    def _close_stdin(self):
+        if not self._proc.stdin.closed:
+            try:
+                self._proc.stdin.close()
+            except BrokenPipeError:
+                pass
+
+    def _join_drains(self):
+        for drain in self._drains:
+            drain.join()
+        self._proc.stdout.close()
+        self._proc.stderr.close()
+
+    def _finish(self) -> bytes:
+        if self._proc is None:
+            return b""
+        self._close_stdin()
+        self._join_drains()
+        if self._proc.wait() != 0:
+            stderr = b"".join(self._stderr_chunks).decode(errors="replace").strip()
+            raise RuntimeError(f"ffmpeg failed to encode video: {stderr}")
+        return b"".join(self._chunks)
+
+
 class PlottingPlotly():
     """
     A class providing static methods for advanced plotting and video generation
@@ -66,13 +600,188 @@ class PlottingPlotly():
             size_col="size", color_col="Spike"
         )
     """
+    # Process pool settings for the Matplotlib-rendered videos, short videos
+    # render serially since starting the workers would cost more than it saves
+    _POOL_MAX_WORKERS = 8
+    _POOL_MIN_FRAMES = 64
+    _POOL_CHUNK_FRAMES = 16
+    # Upper bound on the RGB bytes of one chunk, large canvases get fewer frames
+    _POOL_CHUNK_BYTES = 16 * 2 ** 20
+
+    # Above this many points the interactive scatter skips Plotly Express
+    # and builds a WebGL trace directly
+    _WEBGL_MIN_POINTS = 5000
+
+    # Above this many points the static KDE plot uses the binned estimate
+    # from _compute_kde rather than seaborn's exact per-point evaluation
+    _KDE_BINNED_MIN_POINTS = 5000
+
+    @staticmethod
+    def _pool_chunk_frames(figsize: tuple) -> int:
+        """
+        Number of frames per pool task for a figure of the given size.
+
+        Args:
+            figsize (tuple): Figure size (width, height) in inches.
+
+        Returns:
+            int: Frames per chunk, at most _POOL_CHUNK_FRAMES and at least 1.
+        """
+        dpi = plt.rcParams["figure.dpi"]
+        frame_bytes = int(figsize[0] * dpi) * int(figsize[1] * dpi) * 3
+        return max(1, min(PlottingPlotly._POOL_CHUNK_FRAMES,
+                          PlottingPlotly._POOL_CHUNK_BYTES // max(frame_bytes, 1)))
+
+    @staticmethod
+    def _base_layout() -> dict:
+        """
+        Size and legend shared by the square interactive homography plots.
+
+        Built fresh on every call so one plot can't leak changes into the next.
+
+        Returns:
+            dict: Layout keyword arguments for fig.update_layout.
+        """
+        return dict(
+            height=600,
+            width=600,
+            legend=dict(
+                x=0,  # Horizontal position (0 = far left, 1 = far right)
+                y=1,  # Vertical position (0 = bottom, 1 = top)
+                xanchor="left",  # Anchor the legend to the left
+                yanchor="top",   # Anchor the legend to the top
+                bgcolor="rgba(255,255,255,0.3)",
+                bordercolor="gray",
+                borderwidth=1,
+                font=dict(size=8)
+            )
+        )
+
     @staticmethod
     def _get_lim(homography_points: np.ndarray = None) -> tuple[int, int]:
-        Val.validate_array_int_float(homography_points,
-                                     shape=(4, 2),
-                                     name="Homography Points")
-        diff = (homography_points.max() - homography_points.min())/2
-        return homography_points.min() - diff, homography_points.max() + diff
+        # Stripped under `python -O`, callers validate their points up front
+        if __debug__:
+            Val.validate_array_int_float(homography_points,
+                                         shape=(4, 2),
+                                         name="Homography Points")
+        return PlottingPlotly._lim_from_buffer(homography_points.tobytes(),
+                                               homography_points.dtype.str)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _lim_from_buffer(buffer: bytes, dtype: str) -> tuple[int, int]:
+        # Cached on the raw bytes so repeated calls with the same points are free
+        points = np.frombuffer(buffer, dtype=dtype)
+        low, span = points.min(), np.ptp(points)
+        diff = span / 2
+        return low - diff, low + span + diff
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _get_bgr_colors(cmap_name: str, n: int) -> np.ndarray:
+        """
+        Sample a Matplotlib colormap at n evenly spaced points as BGR colors.
+
+        Cached per (colormap, count), the returned array is read-only.
+
+        Args:
+            cmap_name (str): Name of the Matplotlib colormap.
+            n (int): Number of colors to sample.
+
+        Returns:
+            np.ndarray: (n, 3) uint8 array of BGR colors.
+        """
+        rgba = plt.get_cmap(cmap_name)(np.linspace(0, 1, n))
+        colors = (rgba[:, [2, 1, 0]] * 255).astype(np.uint8)
+        colors.flags.writeable = False
+        return colors
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _get_cmap(cmap_name: str):
+        """
+        Resolve a Matplotlib colormap by name.
+
+        Cached per name, colormaps are not mutated by the plots that use them.
+
+        Args:
+            cmap_name (str): Name of the Matplotlib colormap.
+
+        Returns:
+            Colormap: The colormap.
+
+        Raises:
+            ValueError: If the colormap name is not recognized.
+        """
+        # Try to get the colormap directly by name (from matplotlib or plotly-compatible strings)
+        try:
+            return plt.get_cmap(cmap_name)
+        except ValueError:
+            raise ValueError(
+                f"{cmap_name} is not a recognized Matplotlib colormap.")
+
+    @staticmethod
+    def _build_color_mapper(cmap_name: str, vmin: float, vmax: float):
+        """
+        Build a ScalarMappable for a Matplotlib colormap and value range.
+
+        Built fresh on every call, fig.colorbar attaches the figure's
+        colorbar to it, so a shared instance would outlive its figure.
+
+        Args:
+            cmap_name (str): Name of the Matplotlib colormap.
+            vmin (float): Value mapped to the bottom of the colormap.
+            vmax (float): Value mapped to the top of the colormap.
+
+        Returns:
+            ScalarMappable: The color mapper.
+
+        Raises:
+            ValueError: If the colormap name is not recognized.
+        """
+        return plt.cm.ScalarMappable(norm=plt.Normalize(vmin, vmax),
+                                     cmap=PlottingPlotly._get_cmap(cmap_name))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _video_codec() -> str:
+        """
+        Pick the H.264 encoder used for all generated videos.
+
+        Uses NVIDIA's hardware encoder (h264_nvenc) when ffmpeg supports it and
+        a GPU is available, otherwise falls back to the CPU encoder (libx264).
+        The probe runs a one-frame test encode and is only done once per session.
+
+        Returns:
+            str: The ffmpeg codec name.
+        """
+        probe = [imageio_ffmpeg.get_ffmpeg_exe(), "-hide_banner", "-loglevel", "error",
+                 "-f", "lavfi", "-i", "color=black:s=256x256", "-frames:v", "1",
+                 "-c:v", "h264_nvenc", "-f", "null", "-"]
+        try:
+            result = subprocess.run(probe, capture_output=True, timeout=10)
+        except (OSError, subprocess.SubprocessError):
+            return "libx264"
+        return "h264_nvenc" if result.returncode == 0 else "libx264"
+
+    @staticmethod
+    def _make_writer(fps: int, fast: bool = False) -> _VideoPipeWriter:
+        """
+        Create an in-memory video writer using the fastest available H.264 encoder.
+
+        Args:
+            fps (int): Frames per second for the output video.
+            fast (bool): Trade file size and quality for encoding speed. With
+                libx264 this uses the ultrafast preset at CRF 28.
+
+        Returns:
+            _VideoPipeWriter: The video writer, close() returns the video bytes.
+        """
+        codec = PlottingPlotly._video_codec()
+        codec_params = None
+        if fast and codec == "libx264":
+            codec_params = ["-preset", "ultrafast", "-tune", "zerolatency", "-crf", "28"]
+        return _VideoPipeWriter(fps, codec, codec_params)
 
     @staticmethod
     def plot_dual_y_axis(df: pd.DataFrame,
@@ -115,7 +824,7 @@ class PlottingPlotly():
 
             # Plot the first column (primary y-axis)
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=df.index,
                     y=df[columns[0]],
                     name=ylabel_1,
@@ -127,7 +836,7 @@ class PlottingPlotly():
             # Plot the second column (secondary y-axis)
             second_y_data = -df[columns[1]] if invert_y_2 else df[columns[1]]
             fig.add_trace(
-                go.Scatter(
+                go.Scattergl(
                     x=df.index,
                     y=second_y_data,
                     name=ylabel_2,
@@ -209,52 +918,85 @@ class PlottingPlotly():
         frame_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
         frame_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
 
-        # Get Matplotlib colormaps
-        square_colors = plt.get_cmap(square_cmap)(np.linspace(0, 1, len(df_square.columns) // 2))
-        filament_colors = plt.get_cmap(filament_cmap)(np.linspace(0, 1, len(df_monofil.columns) // 2))
-
-        # Convert colors to BGR and scale to 0–255
-        square_colors = [(int(c[2] * 255), int(c[1] * 255), int(c[0] * 255)) for c in square_colors]
-        filament_colors = [(int(c[2] * 255), int(c[1] * 255), int(c[0] * 255)) for c in filament_colors]
-
-        # Use imageio writer with proper codec
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as tmpfile:
-            temp_path = tmpfile.name
-
-        writer = imageio.get_writer(temp_path, fps=frame_rate, codec='libx264')
-
-        frame_idx = 0
-        while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
-                break
-
-            # Draw square points
-            for i in range(len(df_square.columns) // 2):  # Assuming x, y pairs
-                x = int(df_square.iloc[frame_idx, i * 2])
-                y = int(df_square.iloc[frame_idx, i * 2 + 1])
-                color = square_colors[i]  # Use precomputed BGR color
-                cv2.circle(frame, (x, y), radius=5, color=color, thickness=-1)
-
-            # Draw filament points
-            for i in range(len(df_monofil.columns) // 2):  # Assuming x, y pairs
-                x = int(df_monofil.iloc[frame_idx, i * 2])
-                y = int(df_monofil.iloc[frame_idx, i * 2 + 1])
-                color = filament_colors[i]  # Use precomputed BGR color
-                cv2.circle(frame, (x, y), radius=5, color=color, thickness=-1)
+        # BGR colors per point, sampled from the Matplotlib colormaps
+        square_colors = PlottingPlotly._get_bgr_colors(square_cmap, len(df_square.columns) // 2)
+        filament_colors = PlottingPlotly._get_bgr_colors(filament_cmap, len(df_monofil.columns) // 2)
 
-            # Convert frame to RGB for imageio
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            writer.append_data(frame_rgb)
+        # Point coordinates as contiguous (frames, points, 2) int arrays
+        square_pts = np.ascontiguousarray(df_square.values, dtype=np.int32).reshape(
+            len(df_square), -1, 2)
+        filament_pts = np.ascontiguousarray(df_monofil.values, dtype=np.int32).reshape(
+            len(df_monofil), -1, 2)
 
-            frame_idx += 1
+        writer = PlottingPlotly._make_writer(frame_rate)
 
-        cap.release()
-        writer.close()
+        # Decode and encode on their own threads so they overlap with drawing
+        num_frames = len(df_square)
+        read_queue = queue.Queue(maxsize=8)
+        write_queue = queue.Queue(maxsize=8)
+        stop_reading = threading.Event()
+        errors = []
 
-        # Return the video as bytes
-        with open(temp_path, "rb") as f:
-            return f.read()
+        def read_frames():
+            try:
+                frame_idx = 0
+                # grab() only demuxes, so frames past the tracked range are never decoded
+                while (frame_idx < num_frames and not stop_reading.is_set()
+                       and cap.grab()):
+                    ret, frame = cap.retrieve()
+                    if not ret:
+                        break
+                    read_queue.put((frame_idx, frame))
+                    frame_idx += 1
+            except Exception as e:
+                errors.append(e)
+            finally:
+                read_queue.put(None)
+
+        def write_frames():
+            while (frame_rgb := write_queue.get()) is not None:
+                if errors:
+                    continue  # Keep draining so the drawing loop never blocks
+                try:
+                    writer.append_data(frame_rgb)
+                except Exception as e:
+                    errors.append(e)
+
+        reader_thread = threading.Thread(target=read_frames, daemon=True)
+        writer_thread = threading.Thread(target=write_frames, daemon=True)
+        reader_thread.start()
+        writer_thread.start()
+
+        # Leaving the block before close() aborts ffmpeg
+        with writer:
+            try:
+                while (item := read_queue.get()) is not None:
+                    if errors:
+                        break  # Reading or encoding failed, stop drawing frames
+                    frame_idx, frame = item
+
+                    # Draw square points, then filament points on top
+                    _draw_disks(frame, square_pts[frame_idx], square_colors, 5)
+                    _draw_disks(frame, filament_pts[frame_idx], filament_colors, 5)
+
+                    # Convert frame to RGB for the encoder
+                    write_queue.put(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            finally:
+                # Unblock the reader if it is waiting on a full queue
+                stop_reading.set()
+                while reader_thread.is_alive():
+                    try:
+                        read_queue.get(timeout=0.1)
+                    except queue.Empty:
+                        pass
+                write_queue.put(None)
+                writer_thread.join()
+                cap.release()
+
+            if errors:
+                raise errors[0]
+
+            return writer.close()
 
     @staticmethod
     def generate_homography_video(homography_points: np.ndarray,
@@ -295,8 +1037,9 @@ class PlottingPlotly():
         Val.validate_type(figsize, tuple, "Figure Size")
 
         fig, ax = plt.subplots(figsize=figsize)
-        ax.set_xlim(PlottingPlotly._get_lim(homography_points))
-        ax.set_ylim(PlottingPlotly._get_lim(homography_points))
+        lim = PlottingPlotly._get_lim(homography_points)
+        ax.set_xlim(lim)
+        ax.set_ylim(lim)
         ax.set_title(title)
         ax.set_xlabel(x_label)
         ax.set_ylabel(y_label)
@@ -307,25 +1050,21 @@ class PlottingPlotly():
 
         line, = ax.plot([], [], 'bo-', color=color)
 
-        def init():
-            line.set_data([], [])
-            return line,
-
-        def update(frame):
-            points = df_transformed_monofil.iloc[frame].values.reshape(-1, 2)
-            line.set_data(points[:, 0], points[:, 1])
-            return line,
-
-        anim = FuncAnimation(fig, update, frames=len(df_transformed_monofil),
-                             init_func=init, blit=True, interval=1000 / fps)
-
-        # Save to a temp file and return bytes
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp4")
-        anim.save(temp_file.name, fps=fps, extra_args=['-vcodec', 'libx264'])
+        # Reshape all frames once to (frames, points, 2) instead of per-frame iloc
+        pts_all = df_transformed_monofil.to_numpy().reshape(
+            len(df_transformed_monofil), -1, 2)
 
-        with open(temp_file.name, "rb") as f:
-            video_bytes = f.read()
-        return video_bytes
+        # Render each frame straight into the encoder pipe
+        writer = PlottingPlotly._make_writer(fps)
+        try:
+            with writer:
+                for points in pts_all:
+                    line.set_data(points[:, 0], points[:, 1])
+                    fig.canvas.draw()
+                    writer.append_data(np.asarray(fig.canvas.buffer_rgba()))
+                return writer.close()
+        finally:
+            plt.close(fig)
 
     @staticmethod
     def plot_homography_interactive(homography_points: np.ndarray,
@@ -359,35 +1098,34 @@ class PlottingPlotly():
         Val.validate_strings(title=title, color=color,
                              x_label=x_label, y_label=y_label)
 
-        # Create frames
-        frames = []
-        for i in range(len(df_transformed_monofil)):
-            points = df_transformed_monofil.iloc[i].values.reshape(-1, 2)
-            frames.append(go.Frame(
-                data=[
-                    go.Scatter(
-                        x=points[:, 0],
-                        y=points[:, 1],
-                        mode='lines+markers',
-                        line=dict(color=color),
-                        marker=dict(size=6)
-                    )
-                ],
-                name=str(i)
-            ))
+        lim = PlottingPlotly._get_lim(homography_points)
+
+        # Reshape all frames once to (frames, points, 2) instead of per-frame iloc
+        pts_all = df_transformed_monofil.to_numpy().reshape(
+            len(df_transformed_monofil), -1, 2)
+
+        # Create frames as plain dicts, go.Figure coerces them in a single pass
+        frames = [dict(name=str(i),
+                       data=[dict(type='scattergl',
+                                  x=points[:, 0],
+                                  y=points[:, 1],
+                                  mode='lines+markers',
+                                  line=dict(color=color),
+                                  marker=dict(size=6))])
+                  for i, points in enumerate(pts_all)]
 
         # Get overall frame to define layout
-        init_points = df_transformed_monofil.iloc[0].values.reshape(-1, 2)
+        init_points = pts_all[0]
 
         # Layout
         layout = go.Layout(
             title=title,
             title_x=0.5,
             xaxis=dict(title=x_label,
-                       range=PlottingPlotly._get_lim(homography_points),
+                       range=lim,
                        showgrid=False, zeroline=False),
             yaxis=dict(title=y_label,
-                       range=PlottingPlotly._get_lim(homography_points),
+                       range=lim,
                        showgrid=False, zeroline=False),
             updatemenus=[dict(
                 type='buttons',
@@ -428,26 +1166,29 @@ class PlottingPlotly():
 
         # Combine into figure
         fig = go.Figure(
-            data=[go.Scatter(x=init_points[:, 0], y=init_points[:, 1],
-                             mode='lines+markers',
-                             line=dict(color=color),
-                             marker=dict(size=6))],
+            data=[go.Scattergl(x=init_points[:, 0], y=init_points[:, 1],
+                               mode='lines+markers',
+                               line=dict(color=color),
+                               marker=dict(size=6),
+                               showlegend=False)],
             layout=layout,
             frames=frames
         )
 
-        # Add reference lines for homography box
-        for pt in homography_points:
-            fig.add_shape(type="line",
-                          x0=pt[0], x1=pt[0],
-                          y0=PlottingPlotly._get_lim(homography_points)[0],
-                          y1=PlottingPlotly._get_lim(homography_points)[1],
-                          line=dict(dash="dash", color="gray", width=1))
-            fig.add_shape(type="line",
-                          x0=PlottingPlotly._get_lim(homography_points)[0],
-                          x1=PlottingPlotly._get_lim(homography_points)[1],
-                          y0=pt[1], y1=pt[1],
-                          line=dict(dash="dash", color="gray", width=1))
+        # Add reference lines for homography box, one NaN-separated trace per direction
+        n_points = len(homography_points)
+        span = np.tile([lim[0], lim[1], np.nan], n_points)
+        vertical = np.repeat(homography_points[:, 0].astype(float), 3)
+        horizontal = np.repeat(homography_points[:, 1].astype(float), 3)
+        vertical[2::3] = np.nan
+        horizontal[2::3] = np.nan
+        reference_line = dict(dash="dash", color="gray", width=1)
+        fig.add_trace(go.Scattergl(x=vertical, y=span, mode="lines",
+                                   line=reference_line, hoverinfo="skip",
+                                   showlegend=False))
+        fig.add_trace(go.Scattergl(x=span, y=horizontal, mode="lines",
+                                   line=reference_line, hoverinfo="skip",
+                                   showlegend=False))
 
         return fig
 
@@ -464,10 +1205,16 @@ class PlottingPlotly():
                                  ylabel: str = "y (mm)",
                                  fps: int = 30,
                                  figsize: tuple[int] = (12, 12),
-                                 cmap: str = "viridis") -> bytes:
+                                 cmap: str = "viridis",
+                                 data_fps: float = None) -> bytes:
         """
         Create an animated video visualizing receptive field mapping.
 
+        By default one video frame is rendered per data row. If data_fps is
+        given, rows are grouped so that one video frame is rendered per
+        round(data_fps / fps) rows; each frame still shows the full history
+        up to its last row, and the final frame always shows every row.
+
         Args:
             merged_data (MergedData): The merged data object.
             x_col (str): Name of the x-axis column.
@@ -483,6 +1230,8 @@ class PlottingPlotly():
             fps (int): Frames per second for the video.
             figsize (tuple): Figure size (width, height).
             cmap (str): Colormap name.
+            data_fps (float, optional): Sampling rate of the data rows. When
+                None, every row is rendered as its own frame.
 
         Returns:
             bytes: The video as a byte stream.
@@ -500,97 +1249,75 @@ class PlottingPlotly():
         Val.validate_type(spikes, bool, "Spikes")
         Val.validate_positive(fps, "FPS", zero_allowed=False)
         Val.validate_type(figsize, tuple, "Figure Size")
+        if data_fps is not None:
+            Val.validate_positive(data_fps, "Data FPS", zero_allowed=False)
 
         df = merged_data.threshold_data(bending, spikes)
 
-        # Normalize size and color
-        scaler = MinMaxScaler(feature_range=(1, 30))
-        df["scaled_size"] = scaler.fit_transform(df[[size_col]]) * 5
+        # Normalize size to [1, 30] (constant columns map to 1) and color
+        # NaN sizes stay NaN, like MinMaxScaler, instead of spreading to every row
+        sizes = df[size_col].to_numpy(dtype=float)
+        size_min = np.nanmin(sizes)
+        size_range = np.nanmax(sizes) - size_min
+        if size_range == 0:
+            df["scaled_size"] = 5.0
+        else:
+            df["scaled_size"] = (1 + 29 * (sizes - size_min) / size_range) * 5
 
+        color_mapper = None
         if color_col == "Spike":
-            color_map = df["Spike"].apply(
-                lambda x: 'blue' if x > 0 else 'grey')
+            color_map = to_rgba_array(
+                np.where(df["Spike"].to_numpy() > 0, 'blue', 'grey'))
         else:
-            # Try to get the colormap directly by name (from matplotlib or plotly-compatible strings)
-            try:
-                resolved_cmap = plt.get_cmap(cmap)
-            except ValueError:
-                raise ValueError(
-                    f"{cmap} is not a recognized Matplotlib colormap.")
-
-            color_norm = plt.Normalize(df[color_col].min(),
-                                       df[color_col].max())
-            color_mapper = plt.cm.ScalarMappable(norm=color_norm,
-                                                 cmap=resolved_cmap)
-            color_map = color_mapper.to_rgba(df[color_col])
-
-        # Set up video writer
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as tmpfile:
-            temp_path = tmpfile.name
-
-        writer = imageio.get_writer(temp_path, fps=fps, codec='libx264')
-
-        # Before loop
-        history_x, history_y, history_size, history_color = [], [], [], []
-
-        # Inside loop
-        for frame_idx in range(len(df)):
-            fig, ax = plt.subplots(figsize=figsize)
-            ax.set_xlim(PlottingPlotly._get_lim(homography_points))
-            ax.set_ylim(PlottingPlotly._get_lim(homography_points))
-            ax.set_title(title)
-            ax.set_xlabel(xlabel)
-            ax.set_ylabel(ylabel)
-
-            # Homography lines
-            for point in homography_points:
-                ax.axhline(y=point[1], color='gray', linestyle='--', alpha=0.5)
-                ax.axvline(x=point[0], color='gray', linestyle='--', alpha=0.5)
-
-            # Append current frame data to history
-            current_row = df.iloc[frame_idx]
-            history_x.append(current_row[x_col])
-            history_y.append(current_row[y_col])
-            history_size.append(current_row["scaled_size"])
-            history_color.append(
-                color_map[frame_idx] if color_col != "Spike" else color_map.iloc[frame_idx]
-            )
-
-            # Plot all points up to current frame
-            ax.scatter(history_x, history_y, s=history_size, c=history_color,
-                       alpha=0.7, edgecolors=None)
-
-            # Add legend or colorbar
-            if color_col == "Spike":
-                legend_elements = [
-                    Line2D([0], [0], marker='o', color='w',
-                           markerfacecolor='blue', markersize=10,
-                           label='Spike'),
-                    Line2D([0], [0], marker='o', color='w',
-                           markerfacecolor='grey', markersize=10,
-                           label='No Spike')
-                ]
-                ax.legend(handles=legend_elements, loc="upper left",
-                          title=f"Spike Status\n Circle Size ∝ {size_col}")
+            color_mapper = PlottingPlotly._build_color_mapper(
+                cmap, float(df[color_col].min()), float(df[color_col].max()))
+            color_map = color_mapper.to_rgba(df[color_col].to_numpy())
+
+        lim = PlottingPlotly._get_lim(homography_points)
+        figure_args = (figsize, lim, homography_points, title, xlabel, ylabel,
+                       size_col, color_col, color_mapper)
+
+        # Extract the plotted columns once into float32 arrays, the history
+        # shown at each frame is just a prefix slice of them
+        num_frames = len(df)
+        history_xy = np.empty((num_frames, 2), dtype=np.float32)
+        history_xy[:, 0] = df[x_col].to_numpy()
+        history_xy[:, 1] = df[y_col].to_numpy()
+        history_size = df["scaled_size"].to_numpy(dtype=np.float32)
+        history_color = np.asarray(color_map, dtype=np.float32)
+        history = (history_xy, history_size, history_color)
+
+        # Rows per rendered frame, 1 unless the data is sampled faster than the video.
+        # Each frame shows all points up to its last row
+        stride = 1 if data_fps is None else max(1, int(round(data_fps / fps)))
+        frame_ends = [min(end, num_frames)
+                      for end in range(stride, num_frames + stride, stride)]
+
+        # Set up video writer, ffmpeg is aborted if rendering fails
+        writer = PlottingPlotly._make_writer(fps)
+        with writer:
+            workers = min(os.cpu_count() or 1, PlottingPlotly._POOL_MAX_WORKERS)
+            if workers > 1 and len(frame_ends) >= PlottingPlotly._POOL_MIN_FRAMES:
+                # Render chunks of frames on worker processes, each with its own copy
+                # of the figure, and encode them in order as they complete. Unlike
+                # the serial path the frames are RGB copies rather than the canvas
+                # buffer, so chunks are sized by the canvas to bound their memory
+                for frame in _render_in_pool(_init_rf_worker, (figure_args, history),
+                                             _render_rf_chunk, frame_ends, workers,
+                                             PlottingPlotly._pool_chunk_frames(figsize)):
+                    writer.append_data(frame)
             else:
-                ax.legend(loc="upper left",
-                          title=f"Circle Size ∝ {size_col}")
-                cbar = fig.colorbar(color_mapper, ax=ax)
-                cbar.set_label(f'{color_col} (Color)')
-
-            # Convert Matplotlib figure to an image
-            fig.canvas.draw()
-            frame = np.array(fig.canvas.renderer.buffer_rgba())
-            plt.close(fig)
-
-            # Write the frame to the video
-            writer.append_data(frame)
-
-        writer.close()
-
-        # Return video bytes
-        with open(temp_path, "rb") as f:
-            return f.read()
+                # Build the static parts of the figure once, only the scatter changes per frame
+                fig, scat = _build_rf_figure(*figure_args)
+                try:
+                    for k in frame_ends:
+                        # Stream the canvas buffer straight to the encoder, no copy
+                        writer.append_data(_render_rf_frame(fig, scat, history, k))
+                finally:
+                    plt.close(fig)
+
+            # Return video bytes
+            return writer.close()
 
     @staticmethod
     def _compute_kde(df: pd.DataFrame,
@@ -615,10 +1342,57 @@ class PlottingPlotly():
         """
         xmin, xmax, ymin, ymax = grid_limits
         xx, yy = np.mgrid[xmin:xmax:200j, ymin:ymax:200j]
-        positions = np.vstack([xx.ravel(), yy.ravel()])
         values = np.vstack([df[x_col].values, df[y_col].values])
+        values = values[:, np.isfinite(values).all(axis=0)]
+        # gaussian_kde resolves bw_method into the kernel covariance
         kernel = gaussian_kde(values, bw_method=bw_method)
-        zz = np.reshape(kernel(positions).T, xx.shape)
+
+        # Linearly bin the data onto the grid, with a margin wide enough to
+        # catch the kernel tails of points just outside it, and convolve with
+        # the kernel via FFT instead of summing every point at every grid position
+        nx, ny = xx.shape
+        dx = (xmax - xmin) / (nx - 1)
+        dy = (ymax - ymin) / (ny - 1)
+        if dx <= 0 or dy <= 0 or values.shape[1] <= 32:
+            # Degenerate grid or few samples, evaluate the exact sum directly
+            positions = np.vstack([xx.ravel(), yy.ravel()])
+            zz = _kde_eval(positions, np.ascontiguousarray(values, dtype=float),
+                           kernel.covariance)
+            return xx, yy, zz.reshape(xx.shape)
+        sigma_x, sigma_y = np.sqrt(np.diag(kernel.covariance))
+        pad_x = min(int(np.ceil(4 * sigma_x / dx)), nx)
+        pad_y = min(int(np.ceil(4 * sigma_y / dy)), ny)
+        bins_x, bins_y = nx + 2 * pad_x, ny + 2 * pad_y
+
+        grid_x = (values[0] - xmin) / dx + pad_x
+        grid_y = (values[1] - ymin) / dy + pad_y
+        idx_x = np.floor(grid_x).astype(int)
+        idx_y = np.floor(grid_y).astype(int)
+        frac_x = grid_x - idx_x
+        frac_y = grid_y - idx_y
+        counts = np.zeros(bins_x * bins_y)
+        for step_x, weight_x in ((0, 1 - frac_x), (1, frac_x)):
+            for step_y, weight_y in ((0, 1 - frac_y), (1, frac_y)):
+                cell_x, cell_y = idx_x + step_x, idx_y + step_y
+                inside = ((cell_x >= 0) & (cell_x < bins_x) &
+                          (cell_y >= 0) & (cell_y < bins_y))
+                counts += np.bincount(cell_x[inside] * bins_y + cell_y[inside],
+                                      weights=(weight_x * weight_y)[inside],
+                                      minlength=bins_x * bins_y)
+        counts = counts.reshape(bins_x, bins_y)
+
+        # Gaussian kernel evaluated on the grid offsets
+        off_x, off_y = np.meshgrid(np.arange(-pad_x, pad_x + 1) * dx,
+                                   np.arange(-pad_y, pad_y + 1) * dy,
+                                   indexing="ij")
+        offsets = np.stack([off_x, off_y], axis=-1)
+        quad = np.einsum("...i,ij,...j->...", offsets, kernel.inv_cov, offsets)
+        norm = 2 * np.pi * np.sqrt(np.linalg.det(kernel.covariance))
+        kernel_grid = np.exp(-0.5 * quad) / norm
+
+        zz = fftconvolve(counts, kernel_grid, mode="valid") / values.shape[1]
+        # FFT round-off can leave tiny negative values
+        np.clip(zz, 0, None, out=zz)
         return xx, yy, zz
 
     @staticmethod
@@ -670,8 +1444,7 @@ class PlottingPlotly():
         Val.validate_type(spikes, bool, "Spikes")
 
         # KDE 2D grid limits
-        xmin, xmax = PlottingPlotly._get_lim(homography_points)
-        ymin, ymax = PlottingPlotly._get_lim(homography_points)
+        xmin, xmax = ymin, ymax = PlottingPlotly._get_lim(homography_points)
         grid_limits = (xmin, xmax, ymin, ymax)
 
         # Determine opacity based on conditions
@@ -692,11 +1465,11 @@ class PlottingPlotly():
             zz_bending[zz_bending < bending_threshold] = float(
                 'nan')  # Mask low-density areas
 
-            fig.add_trace(go.Contour(
-                z=zz_bending.T, x=xx[:, 0], y=yy[0],
+            fig.add_trace(go.Heatmap(
+                z=zz_bending.T.astype(np.float32), x=xx[:, 0], y=yy[0],
                 colorscale=cmap_bending,
                 showscale=True if not spikes else False,
-                contours=dict(showlines=False),
+                zsmooth='best',
                 opacity=opacity,
                 name="Bending KDE"
             ))
@@ -714,11 +1487,11 @@ class PlottingPlotly():
             zz_spikes[zz_spikes < spikes_threshold] = float(
                 'nan')  # Mask low-density areas
 
-            fig.add_trace(go.Contour(
-                z=zz_spikes.T, x=xx[:, 0], y=yy[0],
+            fig.add_trace(go.Heatmap(
+                z=zz_spikes.T.astype(np.float32), x=xx[:, 0], y=yy[0],
                 colorscale=cmap_spikes,
                 showscale=True,
-                contours=dict(showlines=False),
+                zsmooth='best',
                 opacity=opacity,
                 name="Spikes KDE"
             ))
@@ -733,23 +1506,12 @@ class PlottingPlotly():
 
         # Update layout
         fig.update_layout(
+            **PlottingPlotly._base_layout(),
             title=title,
             xaxis_title=xlabel,
             yaxis_title=ylabel,
             xaxis_range=[xmin, xmax],
-            yaxis_range=[ymin, ymax],
-            height=600,
-            width=600,
-            legend=dict(
-                x=0,  # Horizontal position (0 = far left, 1 = far right)
-                y=1,  # Vertical position (0 = bottom, 1 = top)
-                xanchor="left",  # Anchor the legend to the left
-                yanchor="top",   # Anchor the legend to the top
-                bgcolor="rgba(255,255,255,0.3)",
-                bordercolor="gray",
-                borderwidth=1,
-                font=dict(size=8)
-            )
+            yaxis_range=[ymin, ymax]
         )
 
         return fig
@@ -799,24 +1561,13 @@ class PlottingPlotly():
 
         df = merged_data.threshold_data(bending, spikes)
 
-        scaler = MinMaxScaler(feature_range=(5, 30))
-        scaled_size = scaler.fit_transform(
-            df[[size_col]]).flatten()  # Flatten to 1D array
+        # Scale marker sizes to [5, 30], constant columns map to 5
+        sizes = df[size_col].to_numpy(dtype=float)
+        size_min = np.nanmin(sizes)
+        size_range = np.nanmax(sizes) - size_min
+        scaled_size = 5 + 25 * (sizes - size_min) / (size_range or 1)
 
-        if color_col == 'Spike':
-            df['Color'] = df['Spike'].apply(
-                lambda x: 'Spike' if x > 0 else 'No Spike')
-            fig = px.scatter(
-                df, x=x_col, y=y_col,
-                size=scaled_size,
-                size_max=7,
-                color='Color',
-                color_discrete_map={'Spike': 'blue', 'No Spike': 'grey'},
-                title=title,
-                labels={x_col: xlabel, y_col: ylabel},
-                opacity=0.5
-            )
-        else:
+        if color_col != 'Spike' and len(df) <= PlottingPlotly._WEBGL_MIN_POINTS:
             fig = px.scatter(
                 df, x=x_col, y=y_col,
                 size=scaled_size,
@@ -831,6 +1582,34 @@ class PlottingPlotly():
             fig.update_layout(
                 coloraxis_colorbar=dict(title=f'{color_col} (Color)')
             )
+        else:
+            # Same sizing as px.scatter(size_max=7), without its DataFrame copy
+            marker = dict(size=scaled_size, sizemode='area',
+                          sizeref=2.0 * np.nanmax(scaled_size) / 7 ** 2,
+                          opacity=0.5)
+            fig = go.Figure()
+            if color_col == 'Spike':
+                # One trace colored per point, the legend entries hold no data
+                marker.update(color=np.where(df['Spike'].to_numpy() > 0,
+                                             'blue', 'grey'))
+                for name, color in (('Spike', 'blue'), ('No Spike', 'grey')):
+                    fig.add_trace(go.Scattergl(
+                        x=[None], y=[None], mode='markers', name=name,
+                        marker=dict(color=color)
+                    ))
+            else:
+                marker.update(color=df[color_col].to_numpy(),
+                              coloraxis='coloraxis')
+                fig.update_layout(coloraxis=dict(
+                    colorscale=cmap,
+                    colorbar=dict(title=f'{color_col} (Color)')
+                ))
+            fig.add_trace(go.Scattergl(
+                x=df[x_col].to_numpy(), y=df[y_col].to_numpy(),
+                mode='markers', marker=marker, showlegend=False
+            ))
+            fig.update_layout(title=title, xaxis_title=xlabel,
+                              yaxis_title=ylabel)
 
         # Homography outline
         hp = np.vstack([homography_points, homography_points[0]])  # Close loop
@@ -841,22 +1620,12 @@ class PlottingPlotly():
         ))
 
         # Set axis limits
-        xmin, xmax = PlottingPlotly._get_lim(homography_points)
-        ymin, ymax = PlottingPlotly._get_lim(homography_points)
+        xmin, xmax = ymin, ymax = PlottingPlotly._get_lim(homography_points)
         fig.update_layout(
+            **PlottingPlotly._base_layout(),
             xaxis_range=[xmin, xmax],
             yaxis_range=[ymin, ymax],
-            height=600,
-            width=600,
             legend_title_text=f"Circle Size ∝ {size_col}",
-            legend=dict(
-                x=0,  y=1,
-                xanchor="left",  yanchor="top",
-                bgcolor="rgba(255,255,255,0.3)",
-                bordercolor="gray",
-                borderwidth=1,
-                font=dict(size=8)
-            ),
             xaxis=dict(
                 scaleanchor="y",  # Lock the aspect ratio to make the plot square
                 scaleratio=1      # Ensure equal scaling for x and y axes
@@ -984,11 +1753,26 @@ class PlottingPlotly():
 
         df = merged_data.threshold_data(bending, spikes)
 
-        sns.kdeplot(x=df[x_col], y=df[y_col],
-                    fill=True, cmap=cmap, bw_adjust=0.3, ax=ax, alpha=0.5)
+        lim = PlottingPlotly._get_lim(homography_points)
+        if len(df) > PlottingPlotly._KDE_BINNED_MIN_POINTS:
+            # Same bandwidth (Scott's rule * 0.3) and iso-proportion levels
+            # as the kdeplot below, evaluated on a binned grid
+            n = np.isfinite(df[[x_col, y_col]].to_numpy()).all(axis=1).sum()
+            xx, yy, zz = PlottingPlotly._compute_kde(
+                df, x_col, y_col, (*lim, *lim),
+                bw_method=0.3 * n ** (-1 / 6))
+            desc = np.sort(zz, axis=None)[::-1]
+            mass = np.cumsum(desc) / desc.sum()
+            levels = desc[np.searchsorted(mass, 1 - np.linspace(0.05, 1, 10))
+                          .clip(max=desc.size - 1)]
+            ax.contourf(xx, yy, zz, levels=levels, alpha=0.5,
+                        cmap=sns.color_palette(cmap, as_cmap=True))
+        else:
+            sns.kdeplot(x=df[x_col], y=df[y_col],
+                        fill=True, cmap=cmap, bw_adjust=0.3, ax=ax, alpha=0.5)
 
-        ax.set_xlim(PlottingPlotly._get_lim(homography_points))
-        ax.set_ylim(PlottingPlotly._get_lim(homography_points))
+        ax.set_xlim(lim)
+        ax.set_ylim(lim)
         ax.set_title(title)
         ax.set_xlabel(xlabel)
         ax.set_ylabel(ylabel)
@@ -1064,7 +1848,7 @@ class PlottingPlotly():
 
         # Handle colors
         if color_col == 'Spike':
-            colors = df['Spike'].apply(lambda x: 'blue' if x > 0 else 'grey')
+            colors = np.where(df['Spike'].to_numpy() > 0, 'blue', 'grey')
         else:
             color_norm = plt.Normalize(
                 df[color_col].min(), df[color_col].max())
@@ -1100,8 +1884,9 @@ class PlottingPlotly():
                     bbox=dict(boxstyle="round", facecolor="white", alpha=0.5))
 
         # Set axis limits and labels
-        ax.set_xlim(PlottingPlotly._get_lim(homography_points))
-        ax.set_ylim(PlottingPlotly._get_lim(homography_points))
+        lim = PlottingPlotly._get_lim(homography_points)
+        ax.set_xlim(lim)
+        ax.set_ylim(lim)
         ax.set_title(title)
         ax.set_xlabel(xlabel)
         ax.set_ylabel(ylabel)
@@ -1115,10 +1900,17 @@ class PlottingPlotly():
                                    video_path: str,
                                    title: str = "Scrolling Plot",
                                    color_1: str = "#1f77b4",
-                                   color_2: str = "#d62728") -> bytes:
+                                   color_2: str = "#d62728",
+                                   output_fps: float = None,
+                                   window_size: int = 100) -> bytes:
         """
         Generate a scrolling plot video synchronized with video frames.
 
+        By default every video frame is rendered. If output_fps is below the
+        video's frame rate, only every round(video_fps / output_fps)-th frame
+        is converted and rendered, and the output plays at that reduced rate
+        so it keeps the original duration.
+
         Args:
             merged_data (MergedData): The merged data object.
             columns (list of str): List of column names to plot.
@@ -1126,6 +1918,10 @@ class PlottingPlotly():
             title (str): Title for the plot.
             color_1 (str): Color for the first signal.
             color_2 (str): Color for the second signal.
+            output_fps (float, optional): Frame rate of the output video. When
+                None, the video's own frame rate is used.
+            window_size (int): Number of data rows shown around the current
+                frame. Windows wider than the plot are downsampled with LTTB.
 
         Returns:
             bytes: The video as a byte stream.
@@ -1139,90 +1935,90 @@ class PlottingPlotly():
         Val.validate_path(video_path, file_types=[".mp4", ".avi"])
         Val.validate_strings(title=title, color_1=color_1, color_2=color_2)
         Val.validate_path_exists(video_path)
-
-        df_merged = merged_data.df_merged.copy()
-
-        cap = cv2.VideoCapture(video_path)
-        frame_rate = int(cap.get(cv2.CAP_PROP_FPS))
-        frame_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
-        frame_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        if output_fps is not None:
+            Val.validate_positive(output_fps, "Output FPS", zero_allowed=False)
+        Val.validate_type(window_size, int, "Window Size")
+        Val.validate_positive(window_size, "Window Size", zero_allowed=False)
+
+        # Probe the stream metadata, the reader's first item
+        reader = imageio_ffmpeg.read_frames(video_path, pix_fmt="rgb24")
+        meta = next(reader)
+        frame_rate = int(meta["fps"])
+        frame_width, frame_height = meta["size"]
         scroll_height = frame_height // 5
         figsize = (frame_width / 100, scroll_height / 100)
 
-        window_size = 100
-        frame_idx = 0
-
-        # Use imageio writer with proper codec
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp4") as tmpfile:
-            temp_path = tmpfile.name
+        # Video frames per rendered frame, 1 unless a lower output rate is requested
+        stride = 1
+        if output_fps is not None and frame_rate > 0:
+            stride = max(1, int(round(frame_rate / output_fps)))
+        if stride > 1:
+            # Let ffmpeg drop the skipped frames before RGB conversion and piping
+            reader.close()
+            reader = imageio_ffmpeg.read_frames(
+                video_path, pix_fmt="rgb24",
+                output_params=["-vf", f"select=not(mod(n\\,{stride}))",
+                               "-vsync", "vfr"])
+            next(reader)
 
-        writer = imageio.get_writer(temp_path, fps=frame_rate, codec='libx264')
+        frame_idx = 0
 
-        while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
-                break
-
-            fig_scroll, ax_scroll = plt.subplots(
-                len(columns), 1, figsize=figsize, sharex=True)
-            if len(columns) == 1:
-                ax_scroll = [ax_scroll]
-
-            start_idx = max(0, frame_idx - window_size // 2)
-            end_idx = min(len(df_merged), start_idx + window_size)
-            data_window = df_merged.iloc[start_idx:end_idx]
-
-            start_xlim = start_idx if start_idx != 0 else frame_idx - 50
-            end_xlim = start_xlim + window_size
-
-            line_handles = []
-            line_labels = []
-
-            for i, col in enumerate(columns):
-                ax = ax_scroll[i]
-                ax.clear()
-                color = color_1 if i == 0 else color_2
-
-                # Plot the main signal
-                line, = ax.plot(data_window.index,
-                                data_window[col], label=col, color=color)
-                line_handles.append(line)
-                line_labels.append(col)
-
-                ax.set_ylim(0, df_merged[col].max())
-                ax.set_xlim(start_xlim, end_xlim)
-                ax.axvline(frame_idx, color='black', linestyle='--')
-                ax.xaxis.set_visible(False)
-
-                # Add threshold line if needed
-                if col == "Bending_ZScore":
-                    y = merged_data.threshold
-                    ax.axhline(y=y, color='grey', linestyle='--')
-                    threshold_line = Line2D(
-                        [0], [0], color='grey', linestyle='--', label='Threshold')
-                    line_handles.append(threshold_line)
-                    line_labels.append('Threshold')
-
-            fig_scroll.legend(handles=line_handles,
-                              labels=line_labels,
-                              loc='center right',
-                              ncol=1,
-                              fontsize=8)
-
-            fig_scroll.suptitle(title, fontsize=12)
-            fig_scroll.canvas.draw()
-            scroll_img = np.array(
-                fig_scroll.canvas.renderer.buffer_rgba())[:, :, :3]
-            plt.close(fig_scroll)
-
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            combined_frame = np.vstack((scroll_img, frame_rgb))
-            writer.append_data(combined_frame)
-
-            frame_idx += 1
-
-        cap.release()
-        writer.close()
-
-        with open(temp_path, "rb") as f:
-            return f.read()
+        # Only the plotted columns are read, one contiguous float32 row each
+        df_merged = merged_data.df_merged
+        index = df_merged.index.to_numpy()
+        signals = np.ascontiguousarray(
+            df_merged[columns].to_numpy(dtype=np.float32).T)
+        figure_args = (figsize, columns, index, signals, title,
+                       color_1, color_2, merged_data.threshold)
+
+        # Render the scroll plots on worker processes when the video is long
+        # enough. The frame count is estimated from the metadata, any frames past
+        # the estimate are rendered here and any surplus is simply cancelled
+        duration = meta.get("duration") or 0
+        expected_frames = int(np.ceil(duration * frame_rate / stride))
+        workers = min(os.cpu_count() or 1, PlottingPlotly._POOL_MAX_WORKERS)
+        pool_frames = None
+        if workers > 1 and expected_frames >= PlottingPlotly._POOL_MIN_FRAMES:
+            pool_frames = _render_in_pool(
+                _init_scroll_worker, (figure_args, window_size), _render_scroll_chunk,
+                [n * stride for n in range(expected_frames)], workers,
+                PlottingPlotly._pool_chunk_frames(figsize))
+
+        # Local figure, built once if any frame has to be rendered here
+        scroll = None
+        # Output frame reused for every write, scroll plot rows on top of the
+        # video rows. Allocated once the plot height is known
+        combined_frame = None
+        writer = PlottingPlotly._make_writer(frame_rate / stride, fast=True)
+        try:
+            for frame_bytes in reader:
+                top = None
+                scroll_img = next(pool_frames, None) if pool_frames is not None else None
+                if scroll_img is None:
+                    if scroll is None:
+                        scroll = _build_scroll_figure(*figure_args)
+                    if combined_frame is not None:
+                        top = combined_frame[:plot_height]
+                    scroll_img = _render_scroll_frame(scroll, frame_idx, window_size, out=top)
+
+                if combined_frame is None:
+                    plot_height = scroll_img.shape[0]
+                    combined_frame = np.empty(
+                        (plot_height + frame_height, frame_width, 3), dtype=np.uint8)
+                if scroll_img is not top:
+                    combined_frame[:plot_height] = scroll_img
+                combined_frame[plot_height:] = np.frombuffer(
+                    frame_bytes, dtype=np.uint8).reshape(frame_height, frame_width, 3)
+                writer.append_data(combined_frame)
+
+                frame_idx += stride
+
+            return writer.close()
+        finally:
+            # No-op after a successful close, otherwise stops ffmpeg
+            writer.abort()
+            reader.close()
+            if pool_frames is not None:
+                pool_frames.close()
+            if scroll is not None:
+                plt.close(scroll[0])
@@ -8,9 +8,21 @@ from parameterized import parameterized
 
 
 class TestDataNeuron(unittest.TestCase):
+    mock_csv_file = "tests/mock_neuron_data.csv"
+    mock_xlsx_file = "tests/mock_neuron_data.xlsx"
+
+    @classmethod
+    def setUpClass(cls):
+        # Read the CSV and write the XLSX fixture once, tests only read mock_data
+        cls.mock_data = pd.read_csv(cls.mock_csv_file)
+        cls.mock_data.to_excel(cls.mock_xlsx_file, index=False)
+
+    @classmethod
+    def tearDownClass(cls):
+        if os.path.exists(cls.mock_xlsx_file):
+            os.remove(cls.mock_xlsx_file)
+
     def setUp(self):
-        self.mock_csv_file = "tests/mock_neuron_data.csv"
-        self.mock_data = pd.read_csv(self.mock_csv_file)
         self.data_neuron = DataNeuron(self.mock_csv_file, original_freq=10)
 
     def test_init(self):
@@ -22,18 +34,11 @@ class TestDataNeuron(unittest.TestCase):
         self.assertIsNone(data_neuron_csv.downsampled_df)
 
         # Test initialization with XLSX
-        # Save mock_data as a temporary xlsx file
-        xlsx_path = "tests/mock_neuron_data.xlsx"
-        self.mock_data.to_excel(xlsx_path, index=False)
-        try:
-            data_neuron_xlsx = DataNeuron(xlsx_path, original_freq=10)
-            self.assertIsInstance(data_neuron_xlsx, DataNeuron)
-            self.assertEqual(data_neuron_xlsx.original_freq, 10)
-            self.assertIsInstance(data_neuron_xlsx.df, pd.DataFrame)
-            self.assertIsNone(data_neuron_xlsx.downsampled_df)
-        finally:
-            if os.path.exists(xlsx_path):
-                os.remove(xlsx_path)
+        data_neuron_xlsx = DataNeuron(self.mock_xlsx_file, original_freq=10)
+        self.assertIsInstance(data_neuron_xlsx, DataNeuron)
+        self.assertEqual(data_neuron_xlsx.original_freq, 10)
+        self.assertIsInstance(data_neuron_xlsx.df, pd.DataFrame)
+        self.assertIsNone(data_neuron_xlsx.downsampled_df)
 
     def test_validate_required_columns(self):
         # Test that required columns are validated during initialization
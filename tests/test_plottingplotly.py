@@ -2,8 +2,9 @@ import unittest
 from unittest.mock import patch, MagicMock, mock_open
 import numpy as np
 import pandas as pd
-from plotly.graph_objs import Figure
-from src.post_processing.plotting_plotly import PlottingPlotly
+from plotly.graph_objs import Figure, Scattergl
+from src.post_processing.plotting_plotly import (
+    PlottingPlotly, _VideoPipeWriter, _lttb, _build_scroll_figure, _render_scroll_frame)
 from src.post_processing.datadlc import DataDLC
 from src.post_processing.dataneuron import DataNeuron
 from src.post_processing.mergeddata import MergedData
@@ -148,6 +149,71 @@ class TestPlottingPlotly(unittest.TestCase):
         self.assertIsInstance(video_bytes, bytes)
         self.assertGreater(len(video_bytes), 0)
 
+    def test_video_pipe_writer_close_is_idempotent(self):
+        frame = np.zeros((16, 16, 3), dtype=np.uint8)
+        writer = _VideoPipeWriter(30, "libx264")
+        writer.append_data(frame)
+        video_bytes = writer.close()
+        self.assertGreater(len(video_bytes), 0)
+        self.assertEqual(writer.close(), video_bytes)
+
+        # A failed encode raises the same ffmpeg error on every close
+        writer = _VideoPipeWriter(30, "not_a_codec")
+        with self.assertRaises(RuntimeError) as first:
+            for _ in range(100):
+                writer.append_data(frame)
+            writer.close()
+        with self.assertRaises(RuntimeError) as second:
+            writer.close()
+        self.assertIs(second.exception, first.exception)
+
+    @patch.object(PlottingPlotly, "_video_codec", return_value="not_a_codec")
+    def test_generate_labeled_video_encoder_error(self, mock_codec):
+        # The ffmpeg failure surfaces, not a secondary error from closing the writer
+        with self.assertRaisesRegex(RuntimeError, "ffmpeg"):
+            PlottingPlotly.generate_labeled_video(
+                dlc_data=self.dlc_data,
+                video_path=self.video_path
+            )
+
+    def test_video_pipe_writer_aborts_on_exception(self):
+        writer = _VideoPipeWriter(30, "libx264")
+        with self.assertRaises(KeyError):
+            with writer:
+                writer.append_data(np.zeros((16, 16, 3), dtype=np.uint8))
+                raise KeyError("render failed")
+        self.assertIsNotNone(writer._proc.poll())
+        self.assertFalse(any(drain.is_alive() for drain in writer._drains))
+        with self.assertRaises(RuntimeError):
+            writer.close()
+
+    @patch("src.post_processing.plotting_plotly._render_rf_frame")
+    def test_plot_rf_mapping_animated_aborts_writer_on_error(self, mock_render):
+        mock_render.side_effect = [np.zeros((64, 64, 4), dtype=np.uint8),
+                                   ValueError("render failed")]
+        writers = []
+
+        def make_writer(fps):
+            writers.append(_VideoPipeWriter(fps, "libx264"))
+            return writers[-1]
+
+        df = pd.DataFrame({
+            "x": np.random.rand(5) * 20,
+            "y": np.random.rand(5) * 20,
+            "size": np.random.rand(5) * 10 + 1,
+            "color": np.random.rand(5) * 5,
+        })
+        merged_data = MagicMock(spec=MergedData)
+        merged_data.threshold_data.return_value = df
+        with patch.object(PlottingPlotly, "_make_writer", side_effect=make_writer), \
+                self.assertRaises(ValueError):
+            PlottingPlotly.plot_rf_mapping_animated(
+                merged_data=merged_data, x_col="x", y_col="y",
+                homography_points=self.homography_points,
+                size_col="size", color_col="color", figsize=(4, 4))
+        # ffmpeg was started by the first frame and is no longer running
+        self.assertIsNotNone(writers[0]._proc.poll())
+
     @parameterized.expand([
         ("bad_dlc_type", "not_a_dlc", "valid_path", "Accent", "Blues", TypeError),
         ("bad_path_ext", "_valid_dlc", "video.txt", "Accent", "Blues", ValueError),
@@ -315,6 +381,97 @@ class TestPlottingPlotly(unittest.TestCase):
         self.assertIsInstance(video_bytes, bytes)
         self.assertGreater(len(video_bytes), 0)
 
+    @patch.object(PlottingPlotly, "_make_writer")
+    def test_plot_rf_mapping_animated_data_fps_stride(self, mock_make_writer):
+        # 5 rows at twice the video rate render as 3 frames, the last one showing every row
+        writer = mock_make_writer.return_value
+        writer.close.return_value = b"video"
+        df = pd.DataFrame({
+            "x": np.random.rand(5) * 20,
+            "y": np.random.rand(5) * 20,
+            "size": np.random.rand(5) * 10 + 1,
+            "color": np.random.rand(5) * 5,
+        })
+        merged_data = MagicMock(spec=MergedData)
+        merged_data.threshold_data.return_value = df
+
+        video_bytes = PlottingPlotly.plot_rf_mapping_animated(
+            merged_data=merged_data, x_col="x", y_col="y",
+            homography_points=self.homography_points,
+            size_col="size", color_col="color",
+            fps=30, figsize=(4, 4), data_fps=60
+        )
+        self.assertEqual(video_bytes, b"video")
+        self.assertEqual(writer.append_data.call_count, 3)
+
+    @patch.object(PlottingPlotly, "_make_writer")
+    def test_plot_rf_mapping_animated_nan_size(self, mock_make_writer):
+        # A NaN size only affects its own row
+        mock_make_writer.return_value.close.return_value = b"video"
+        df = pd.DataFrame({
+            "x": np.random.rand(4) * 20,
+            "y": np.random.rand(4) * 20,
+            "size": [1.0, np.nan, 3.0, 5.0],
+            "color": np.random.rand(4) * 5,
+        })
+        merged_data = MagicMock(spec=MergedData)
+        merged_data.threshold_data.return_value = df
+
+        PlottingPlotly.plot_rf_mapping_animated(
+            merged_data=merged_data, x_col="x", y_col="y",
+            homography_points=self.homography_points,
+            size_col="size", color_col="color", figsize=(4, 4)
+        )
+        np.testing.assert_allclose(df["scaled_size"], [5, np.nan, 77.5, 150])
+
+    def test_build_color_mapper_is_not_shared(self):
+        # Only the colormap is cached, each call gets its own mapper
+        first = PlottingPlotly._build_color_mapper("viridis", 0.0, 1.0)
+        second = PlottingPlotly._build_color_mapper("viridis", 0.0, 1.0)
+        self.assertIsNot(first, second)
+        self.assertIs(first.cmap, second.cmap)
+
+    @patch.object(PlottingPlotly, "_make_writer")
+    def test_plot_rf_mapping_animated_parallel_matches_serial(self, mock_make_writer):
+        # Frames rendered on the process pool arrive in order and match serial rendering
+        df = pd.DataFrame({
+            "x": np.random.rand(20) * 20,
+            "y": np.random.rand(20) * 20,
+            "size": np.random.rand(20) * 10 + 1,
+            "Spike": [0, 1] * 10,
+        })
+        merged_data = MagicMock(spec=MergedData)
+        merged_data.threshold_data.return_value = df
+
+        def render():
+            writer = MagicMock()
+            frames = []
+            writer.append_data.side_effect = lambda frame: frames.append(np.array(frame))
+            mock_make_writer.return_value = writer
+            PlottingPlotly.plot_rf_mapping_animated(
+                merged_data=merged_data, x_col="x", y_col="y",
+                homography_points=self.homography_points,
+                size_col="size", color_col="Spike", figsize=(3, 3))
+            return frames
+
+        serial = render()
+        with patch("os.cpu_count", return_value=2), \
+                patch.object(PlottingPlotly, "_POOL_MIN_FRAMES", 1), \
+                patch.object(PlottingPlotly, "_POOL_CHUNK_FRAMES", 3):
+            parallel = render()
+        self.assertEqual(len(parallel), len(serial))
+        for serial_frame, parallel_frame in zip(serial, parallel):
+            # Workers send RGB back, the serial path streams the RGBA canvas
+            np.testing.assert_array_equal(serial_frame[:, :, :3], parallel_frame)
+
+    def test_pool_chunk_frames_scales_with_canvas(self):
+        with patch.dict(plt.rcParams, {"figure.dpi": 100}):
+            self.assertEqual(PlottingPlotly._pool_chunk_frames((3, 3)),
+                             PlottingPlotly._POOL_CHUNK_FRAMES)
+            # 1200 x 1200 RGB frames are ~4.3 MB each
+            self.assertEqual(PlottingPlotly._pool_chunk_frames((12, 12)), 3)
+            self.assertEqual(PlottingPlotly._pool_chunk_frames((50, 50)), 1)
+
     @parameterized.expand([
         ("bad_merged_data",
         "not_merged", "x", "y", "size", "color", "Title",
@@ -399,6 +556,28 @@ class TestPlottingPlotly(unittest.TestCase):
         self.assertEqual(xx.shape, zz.shape)
         self.assertEqual(xx.shape, (200, 200))
 
+    def test_compute_kde_matches_gaussian_kde(self):
+        # The binned FFT estimate should closely match direct evaluation
+        from scipy.stats import gaussian_kde
+        rng = np.random.default_rng(0)
+        x = rng.normal(0, 1, 2000)
+        df = pd.DataFrame({"x": x, "y": 0.5 * x + rng.normal(0, 1, 2000)})
+        xx, yy, zz = PlottingPlotly._compute_kde(df, "x", "y", (-4, 4, -4, 4), bw_method=0.2)
+        expected = gaussian_kde(df[["x", "y"]].values.T, bw_method=0.2)(
+            np.vstack([xx.ravel(), yy.ravel()])).reshape(xx.shape)
+        np.testing.assert_allclose(zz, expected, atol=0.01 * expected.max())
+
+    def test_compute_kde_few_samples_exact(self):
+        # Small sample counts take the direct evaluation path
+        from scipy.stats import gaussian_kde
+        rng = np.random.default_rng(1)
+        x = rng.normal(0, 1, 20)
+        df = pd.DataFrame({"x": x, "y": 0.5 * x + rng.normal(0, 1, 20)})
+        xx, yy, zz = PlottingPlotly._compute_kde(df, "x", "y", (-3, 3, -3, 3), bw_method=0.2)
+        expected = gaussian_kde(df[["x", "y"]].values.T, bw_method=0.2)(
+            np.vstack([xx.ravel(), yy.ravel()])).reshape(xx.shape)
+        np.testing.assert_allclose(zz, expected, rtol=1e-6, atol=1e-12)
+
     def test_compute_kde_invalid_column(self):
         df = pd.DataFrame({
             "x": np.random.normal(0, 1, 100),
@@ -538,6 +717,39 @@ class TestPlottingPlotly(unittest.TestCase):
         self.assertIsInstance(fig, Figure)
         self.assertGreater(len(fig.data), 0)
 
+    @parameterized.expand([
+        ("continuous_color_large", "color", PlottingPlotly._WEBGL_MIN_POINTS + 1),
+        ("spike_color_small", "Spike", 50),
+        ("spike_color_large", "Spike", PlottingPlotly._WEBGL_MIN_POINTS + 1),
+    ])
+    def test_plot_scatter_interactive_uses_webgl(self, name, color_col, num_points):
+        df = pd.DataFrame({
+            "x": np.random.rand(num_points) * 20,
+            "y": np.random.rand(num_points) * 20,
+            "size": np.random.rand(num_points) * 10 + 1,
+            "Spike": np.random.randint(0, 2, num_points),
+            "color": np.random.rand(num_points) * 5,
+        })
+        merged_data = MagicMock(spec=MergedData)
+        merged_data.threshold_data.return_value = df
+
+        fig = PlottingPlotly.plot_scatter_interactive(
+            merged_data=merged_data, x_col="x", y_col="y",
+            homography_points=self.homography_points,
+            size_col="size", color_col=color_col
+        )
+        # All points live in a single WebGL trace
+        points = [trace for trace in fig.data
+                  if trace.mode == 'markers' and trace.showlegend is False]
+        self.assertEqual(len(points), 1)
+        self.assertIsInstance(points[0], Scattergl)
+        self.assertEqual(len(points[0].x), num_points)
+        if color_col == "Spike":
+            expected = np.where(df["Spike"] > 0, "blue", "grey")
+            np.testing.assert_array_equal(points[0].marker.color, expected)
+            legend = {trace.name for trace in fig.data if trace.mode == 'markers'} - {None}
+            self.assertEqual(legend, {"Spike", "No Spike"})
+
     @parameterized.expand([
         ("bad_merged_data", "not_merged", "x", "y", "size", "color", False, False, "Scatter Plot", "x", "y", "Viridis", np.zeros((4, 2)), TypeError),
         ("bad_homography_shape", MagicMock(spec=MergedData), "x", "y", "size", "color", False, False, "Scatter Plot", "x", "y", "Viridis", np.zeros((3, 2)), ValueError),
@@ -667,6 +879,24 @@ class TestPlottingPlotly(unittest.TestCase):
         self.assertIsNotNone(fig)
         self.assertIsNotNone(ax)
 
+    @patch("seaborn.kdeplot")
+    def test_plot_kde_density_large_uses_binned_kde(self, mock_kdeplot):
+        num_points = PlottingPlotly._KDE_BINNED_MIN_POINTS + 1
+        df = pd.DataFrame({
+            "x": np.random.normal(10, 3, num_points),
+            "y": np.random.normal(10, 3, num_points),
+        })
+        merged_data = MagicMock(spec=MergedData)
+        merged_data.threshold_data.return_value = df
+
+        fig, ax = PlottingPlotly.plot_kde_density(
+            merged_data=merged_data, x_col="x", y_col="y",
+            homography_points=self.homography_points
+        )
+        mock_kdeplot.assert_not_called()
+        self.assertGreater(len(ax.collections), 0)
+        plt.close(fig)
+
     @parameterized.expand([
         ("bad_merged_data", "not_merged", "x", "y", np.zeros((4, 2)), False, False, "KDE Plot", "x", "y", (8, 8), "vlag", TypeError),
         ("bad_homography_shape", MagicMock(spec=MergedData), "x", "y", np.zeros((3, 2)), False, False, "KDE Plot", "x", "y", (8, 8), "vlag", ValueError),
@@ -703,25 +933,39 @@ class TestPlottingPlotly(unittest.TestCase):
                 cmap=cmap
             )
 
-    @patch("cv2.VideoCapture")
-    @patch("imageio.get_writer")
-    def test_generate_scroll_over_video_valid(self, mock_writer, mock_cv2cap):
-        # Mock video capture
-        mock_cap = MagicMock()
-        # Simulate 3 frames
-        mock_cap.isOpened.side_effect = [True, True, True, False]
-        mock_cap.read.side_effect = [
-            (True, np.ones((100, 100, 3), dtype=np.uint8)),
-            (True, np.ones((100, 100, 3), dtype=np.uint8)),
-            (True, np.ones((100, 100, 3), dtype=np.uint8)),
-            (False, None)
-        ]
-        mock_cap.get.side_effect = lambda x: {5: 30, 3: 100, 4: 100}[x]  # FPS, WIDTH, HEIGHT
-        mock_cv2cap.return_value = mock_cap
+    def test_lttb_keeps_endpoints_and_peaks(self):
+        x = np.arange(1000, dtype=np.float64)
+        y = np.sin(x / 50)
+        y[437] = 10.0
+        kept = _lttb(x, y, 100)
+        self.assertEqual(len(kept), 100)
+        self.assertEqual((kept[0], kept[-1]), (0, 999))
+        self.assertTrue(np.all(np.diff(kept) > 0))
+        self.assertIn(437, kept)
+        # Short series are returned whole
+        np.testing.assert_array_equal(_lttb(x[:50], y[:50], 100), np.arange(50))
 
-        # Mock imageio writer
-        mock_writer_inst = MagicMock()
-        mock_writer.return_value = mock_writer_inst
+    def test_render_scroll_frame_into_buffer(self):
+        index = np.arange(500)
+        signals = np.random.rand(2, 500).astype(np.float32)
+        scroll = _build_scroll_figure((4, 1), ["a", "Bending_ZScore"], index, signals,
+                                      "Scroll", "red", "blue", 0.5)
+        try:
+            expected = _render_scroll_frame(scroll, 250).copy()
+            combined = np.zeros((expected.shape[0] + 10, expected.shape[1], 3), np.uint8)
+            result = _render_scroll_frame(scroll, 250, out=combined[:expected.shape[0]])
+            self.assertTrue(np.shares_memory(result, combined))
+            np.testing.assert_array_equal(combined[:expected.shape[0]], expected)
+            self.assertFalse(combined[expected.shape[0]:].any())
+        finally:
+            plt.close(scroll[0])
+
+    @patch("imageio_ffmpeg.read_frames")
+    def test_generate_scroll_over_video_valid(self, mock_read_frames):
+        # Mock the ffmpeg reader: metadata first, then 3 RGB frames
+        frame = np.ones((100, 100, 3), dtype=np.uint8).tobytes()
+        mock_read_frames.return_value = (
+            item for item in [{"fps": 30, "size": (100, 100)}, frame, frame, frame])
 
         # Mock merged_data
         merged_data = MagicMock(spec=MergedData)
@@ -732,7 +976,7 @@ class TestPlottingPlotly(unittest.TestCase):
         })
         merged_data.threshold = 0.5
 
-        # Patch open to return dummy bytes
+        # Patch open so the fake video path passes validation
         with patch("builtins.open", mock_open(read_data=b"video_bytes")) as m:
             result = PlottingPlotly.generate_scroll_over_video(
                 merged_data=merged_data,
@@ -744,12 +988,91 @@ class TestPlottingPlotly(unittest.TestCase):
             )
             self.assertIsInstance(result, bytes)
 
-    @patch("cv2.VideoCapture")
-    def test_generate_scroll_over_video_invalid_video(self, mock_cv2cap):
+    @patch.object(PlottingPlotly, "_make_writer")
+    @patch("imageio_ffmpeg.read_frames")
+    def test_generate_scroll_over_video_output_fps(self, mock_read_frames, mock_make_writer):
+        # A 30 fps video rendered at 10 fps lets ffmpeg keep every 3rd frame
+        meta = {"fps": 30, "size": (100, 100)}
+        frame = np.ones((100, 100, 3), dtype=np.uint8).tobytes()
+        mock_read_frames.side_effect = [(item for item in [meta]),
+                                        (item for item in [meta, frame, frame])]
+        mock_make_writer.return_value.close.return_value = b"video"
+
+        merged_data = MagicMock(spec=MergedData)
+        merged_data.df_merged = pd.DataFrame({"A": np.random.rand(10)})
+        merged_data.threshold = 0.5
+
+        with patch("builtins.open", mock_open()):
+            result = PlottingPlotly.generate_scroll_over_video(
+                merged_data=merged_data, columns=["A"],
+                video_path="fake.mp4", output_fps=10)
+        self.assertEqual(result, b"video")
+        mock_make_writer.assert_called_once_with(10, fast=True)
+        output_params = mock_read_frames.call_args.kwargs["output_params"]
+        self.assertIn("select=not(mod(n\\,3))", output_params)
+        self.assertEqual(mock_make_writer.return_value.append_data.call_count, 2)
+
+    @parameterized.expand([
+        ("estimate_too_low", 0.5, 100),
+        ("estimate_too_high", 1.0, 100),
+        # Wider than the 100 px plot, so the window is downsampled with LTTB
+        ("wide_window", 1.0, 400),
+    ])
+    @patch.object(PlottingPlotly, "_make_writer")
+    @patch("imageio_ffmpeg.read_frames")
+    def test_generate_scroll_over_video_parallel_matches_serial(self, name, duration, window_size,
+                                                                mock_read_frames, mock_make_writer):
+        # 20 frames whose metadata duration under- or overestimates the frame count
+        meta = {"fps": 30, "size": (100, 100), "duration": duration}
+        video = [np.full((100, 100, 3), i, dtype=np.uint8).tobytes() for i in range(20)]
+        merged_data = MagicMock(spec=MergedData)
+        merged_data.df_merged = pd.DataFrame({
+            "A": np.random.rand(1000),
+            "Bending_ZScore": np.random.rand(1000)
+        })
+        merged_data.threshold = 0.5
+
+        def render(window_size=window_size):
+            mock_read_frames.return_value = (item for item in [meta] + video)
+            writer = MagicMock()
+            frames = []
+            writer.append_data.side_effect = lambda frame: frames.append(np.array(frame))
+            mock_make_writer.return_value = writer
+            PlottingPlotly.generate_scroll_over_video(
+                merged_data=merged_data, columns=["A", "Bending_ZScore"],
+                video_path=self.video_path, window_size=window_size)
+            return frames
+
+        serial = render()
+        with patch("os.cpu_count", return_value=2), \
+                patch.object(PlottingPlotly, "_POOL_MIN_FRAMES", 1), \
+                patch.object(PlottingPlotly, "_POOL_CHUNK_FRAMES", 4):
+            parallel = render()
+        self.assertEqual(len(serial), 20)
+        self.assertEqual(len(parallel), 20)
+        for i, (serial_frame, parallel_frame) in enumerate(zip(serial, parallel)):
+            np.testing.assert_array_equal(serial_frame, parallel_frame)
+            # Video rows sit below the plot in the reused output frame
+            self.assertTrue((serial_frame[-100:] == i).all())
+        if window_size != 100:
+            self.assertFalse(np.array_equal(serial[0], render(100)[0]))
+
+    @parameterized.expand([
+        ("zero", 0, ValueError),
+        ("float", 50.0, TypeError),
+    ])
+    def test_generate_scroll_over_video_invalid_window_size(self, name, window_size, expected_exc):
+        merged_data = MagicMock(spec=MergedData)
+        merged_data.df_merged = pd.DataFrame({"A": [1, 2, 3]})
+        with self.assertRaises(expected_exc):
+            PlottingPlotly.generate_scroll_over_video(
+                merged_data=merged_data, columns=["A"],
+                video_path=self.video_path, window_size=window_size)
+
+    @patch("imageio_ffmpeg.read_frames")
+    def test_generate_scroll_over_video_invalid_video(self, mock_read_frames):
         # Simulate video cannot be opened
-        mock_cap = MagicMock()
-        mock_cap.isOpened.return_value = False
-        mock_cv2cap.return_value = mock_cap
+        mock_read_frames.side_effect = IOError("Could not open video")
 
         merged_data = MagicMock(spec=MergedData)
         merged_data.df_merged = pd.DataFrame({"A": [1, 2, 3]})